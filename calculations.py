@@ -2,8 +2,44 @@
 Calculation functions for DCA investment strategy with daily-compounded savings.
 """
 
+import math
+import os
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+import numpy as np
 import pandas as pd
-import yfinance as yf
+
+from settings import INVESTMENT_FREQUENCIES
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the simulation kernel runs as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Downloaded price data is cached on disk, one parquet file per (ticker, start, end).
+# Entries expire after a day because adjusted closes are revised after dividends and splits.
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'lazy_investor'
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+NS_PER_DAY = 24 * 60 * 60 * 10**9
+
+# Price data already loaded by this process, so scenarios over the same tickers skip the
+# download and the parquet read. Maps upper-cased ticker to a list of
+# (start_date, end_date, loaded_at, DataFrame) entries, which expire with the on-disk cache.
+# At most MEMORY_CACHE_MAX_ENTRIES entries are kept; the oldest are evicted first.
+MEMORY_CACHE_MAX_ENTRIES = 64
+_memory_cache = {}
+
+# One HTTP session shared by all downloads, so repeat requests reuse open connections instead of
+# paying a new TLS handshake each time. Created by _get_yf_session() on the first download.
+_yf_session = None
 
 
 def download_stock_data(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
@@ -25,27 +61,172 @@ def download_stock_data(ticker: str, start_date: str, end_date: str) -> pd.DataF
         ValueError: If no stock data is found for the given ticker
     """
 
-    stock_data = yf.download(ticker, start=start_date, end=end_date, progress=False)
+    # Single-ticker downloads share the batch code path, including its on-disk cache
+    return download_stock_data_batch([ticker], start_date, end_date)[ticker]
 
-    if stock_data.empty:
-        raise ValueError(f"No stock data found, make sure your ticker is correct: {ticker}")
 
-    # Flatten MultiIndex columns if present
-    if isinstance(stock_data.columns, pd.MultiIndex):
-        # Get the ticker name from the MultiIndex
-        ticker_name = stock_data.columns[0][1]
+def download_stock_data_batch(tickers: list, start_date: str, end_date: str) -> dict:
+    """
+    Download stock/ETF data for several tickers with a single yf.download call.
+    yfinance fetches the tickers on its own worker pool and returns them side by side.
 
-        # Flatten the MultiIndex by taking only the first level (Price)
-        stock_data.columns = stock_data.columns.get_level_values(0)
-    else:
-        ticker_name = ticker
+    Args:
+        tickers: List of stock/ETF ticker symbols (e.g., ['VFV.TO', 'QCN'])
+        start_date: Start date in 'YYYY-MM-DD' format
+        end_date: End date in 'YYYY-MM-DD' format
 
-    # Reset index to make Date a column
-    stock_data = stock_data.reset_index()
+    Returns:
+        Dict mapping each ticker to a DataFrame with columns: date, ticker, open, close, volume
 
-    stock_data['Ticker'] = ticker_name
+    Raises:
+        ValueError: If no stock data is found for one of the tickers
+    """
+    stock_data_dict = {}
+    for ticker in tickers:
+        # In-process cache first (covers wider date ranges too), then the on-disk cache
+        cached_data = _read_memory_cached_stock_data(ticker, start_date, end_date)
+        if cached_data is None:
+            cached_data = _read_cached_stock_data(ticker, start_date, end_date)
+            if cached_data is not None:
+                _write_memory_cached_stock_data(cached_data, ticker, start_date, end_date)
+        if cached_data is not None:
+            stock_data_dict[ticker] = cached_data
+
+    missing_tickers = [ticker for ticker in tickers if ticker not in stock_data_dict]
+    if missing_tickers:
+        # Imported here so the app loads without yfinance until something needs downloading
+        import yfinance as yf
+
+        stock_data = yf.download(
+            missing_tickers,
+            start=start_date,
+            end=end_date,
+            group_by='ticker',
+            auto_adjust=True,
+            threads=True,
+            progress=False,
+            session=_get_yf_session()
+        )
+
+        for ticker in missing_tickers:
+            # yfinance upper-cases ticker names in the returned columns
+            ticker_name = ticker.upper()
+
+            if ticker_name not in stock_data.columns.get_level_values(0):
+                raise ValueError(f"No stock data found, make sure your ticker is correct: {ticker}")
+
+            # Tickers are aligned on a shared date index, so drop the rows where this one didn't trade
+            ticker_data = stock_data[ticker_name].dropna(subset=['Close'])
+
+            if ticker_data.empty:
+                raise ValueError(f"No stock data found, make sure your ticker is correct: {ticker}")
+
+            # Reset index to make Date a column
+            ticker_data.reset_index(inplace=True)
+            ticker_data.columns.name = None
+
+            ticker_data['Ticker'] = ticker_name
+
+            stock_data_dict[ticker] = ticker_data
+            _write_cached_stock_data(ticker_data, ticker, start_date, end_date)
+            _write_memory_cached_stock_data(ticker_data, ticker, start_date, end_date)
+
+    # Keep the caller's ticker order
+    stock_data_dict = {ticker: stock_data_dict[ticker] for ticker in tickers}
+
+    return stock_data_dict
+
+
+def _get_yf_session():
+    """
+    Return the HTTP session shared by all yfinance downloads, creating it on first use.
+    yfinance requires a curl_cffi session.
+    """
+    global _yf_session
+    if _yf_session is None:
+        from curl_cffi import requests as curl_requests
+        _yf_session = curl_requests.Session(impersonate='chrome')
+    return _yf_session
+
+
+def _cache_path(ticker: str, start_date: str, end_date: str) -> Path:
+    """Path of the on-disk cache file for one ticker and date range."""
+    # Percent-encode the ticker so values like '../x' or 'A/B' stay a single name inside CACHE_DIR
+    return CACHE_DIR / f"{quote(ticker.upper(), safe='')}_{start_date}_{end_date}.parquet"
+
+
+def _read_cached_stock_data(ticker: str, start_date: str, end_date: str):
+    """Return cached stock data for a ticker, or None if there is no fresh cache entry."""
+    cache_path = _cache_path(ticker, start_date, end_date)
+    try:
+        if time.time() - cache_path.stat().st_mtime > CACHE_TTL_SECONDS:
+            # Expired: remove the stale file so the cache directory does not grow forever
+            cache_path.unlink(missing_ok=True)
+            return None
+        return pd.read_parquet(cache_path)
+    except (OSError, ImportError, ValueError):
+        # Missing, unreadable or corrupt cache file: download again
+        return None
 
-    return stock_data
+
+def _write_cached_stock_data(stock_data: pd.DataFrame, ticker: str, start_date: str, end_date: str):
+    """Write stock data for a ticker to the on-disk cache. Failures are ignored."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        stock_data.to_parquet(_cache_path(ticker, start_date, end_date), index=False)
+    except (OSError, ImportError, ValueError):
+        pass
+
+
+def _read_memory_cached_stock_data(ticker: str, start_date: str, end_date: str):
+    """
+    Return stock data for a ticker from the in-process cache, or None if no fresh entry covers
+    the date range with at least one trading day. Data loaded for a wider date range is sliced
+    down to the requested one.
+    """
+    if start_date > end_date:
+        return None
+
+    now = time.time()
+    for cached_start, cached_end, loaded_at, stock_data in _memory_cache.get(ticker.upper(), []):
+        if now - loaded_at <= CACHE_TTL_SECONDS and cached_start <= start_date and end_date <= cached_end:
+            # The end date is exclusive, as in yf.download
+            in_range = (stock_data['Date'] >= start_date) & (stock_data['Date'] < end_date)
+            if not in_range.any():
+                # No trading days in the range: let the download path report it
+                return None
+            return stock_data[in_range].reset_index(drop=True)
+    return None
+
+
+def _write_memory_cached_stock_data(stock_data: pd.DataFrame, ticker: str, start_date: str, end_date: str):
+    """
+    Add stock data for a ticker to the in-process cache. Expired entries of every ticker, and
+    entries of this ticker covered by the new date range, are dropped; if the cache is still
+    over MEMORY_CACHE_MAX_ENTRIES, the oldest entries are evicted.
+    """
+    now = time.time()
+    for cached_ticker in list(_memory_cache):
+        entries = [
+            entry for entry in _memory_cache[cached_ticker]
+            if now - entry[2] <= CACHE_TTL_SECONDS
+            and not (cached_ticker == ticker.upper() and start_date <= entry[0] and entry[1] <= end_date)
+        ]
+        if entries:
+            _memory_cache[cached_ticker] = entries
+        else:
+            del _memory_cache[cached_ticker]
+
+    # Keep a private copy, so callers mutating the data they were given cannot change later hits
+    _memory_cache.setdefault(ticker.upper(), []).append((start_date, end_date, now, stock_data.copy()))
+
+    entry_count = sum(len(entries) for entries in _memory_cache.values())
+    while entry_count > MEMORY_CACHE_MAX_ENTRIES:
+        oldest_ticker = min(_memory_cache, key=lambda cached_ticker: _memory_cache[cached_ticker][0][2])
+        _memory_cache[oldest_ticker].pop(0)
+        if not _memory_cache[oldest_ticker]:
+            del _memory_cache[oldest_ticker]
+        entry_count -= 1
 
 
 def calculate_daily_interest_rate(annual_rate: float) -> float:
@@ -71,36 +252,154 @@ def get_investment_interval_days(frequency: str) -> int:
     Returns:
         Number of days between investments
     """
-    freq_days = {
-        'Twice a week': 3.5,
-        'Weekly': 7,
-        'Every two weeks': 14,
-        'Monthly': 30
-    }
-    return freq_days.get(frequency, 7)
+    return INVESTMENT_FREQUENCIES.get(frequency, 7)
+
+
+@njit(
+    '(float64[:, ::1], boolean[:], float64[:], float64, float64, int64, float64, boolean)',
+    cache=True,
+    fastmath=True
+)
+def _simulate_core(
+    daily_prices: np.ndarray,
+    tradable: np.ndarray,
+    ticker_amounts: np.ndarray,
+    daily_rate: float,
+    investment_amount: float,
+    investment_interval: int,
+    initial_savings: float,
+    check_balance: bool
+) -> tuple:
+    """
+    Run the day-by-day savings and investment simulation over NumPy arrays.
 
+    Compiled with Numba when it is installed. Interest, investing and valuing the holdings are
+    done in one pass per day, so each day's prices are read once and only the daily totals are
+    stored, not the shares held per ticker per day.
 
-def get_stock_price(stock_data: pd.DataFrame, date: pd.Timestamp) -> float:
+    Args:
+        daily_prices: Closing prices, shape (num_days, num_tickers), aligned to the daily calendar
+        tradable: Boolean array, True on days where every ticker has a closing price
+        ticker_amounts: Amount invested in each ticker per investment, in daily_prices column order
+        daily_rate: Daily interest rate as decimal
+        investment_amount: Fixed amount to invest each period (sum of ticker_amounts)
+        investment_interval: Whole number of days between investments
+        initial_savings: Initial amount in savings account
+        check_balance: Whether to check that savings cover each investment. Pass False when
+                       the balance provably never runs short (see calculate_dca_returns).
+
+    Returns:
+        Tuple of (portfolio_values, savings_over_time, daily_interest, invest_flags, final_shares):
+            - portfolio_values: Value of all holdings at the end of each day
+            - savings_over_time: Savings balance at the end of each day
+            - daily_interest: Interest credited to savings each day
+            - invest_flags: Boolean array, True on days an investment was made
+            - final_shares: Shares held per ticker at the end of the period
     """
-    Get the closing price for a specific date.
+    num_days, num_tickers = daily_prices.shape
+    portfolio_values = np.empty(num_days)
+    savings_over_time = np.empty(num_days)
+    daily_interest = np.empty(num_days)
+    invest_flags = np.zeros(num_days, dtype=np.bool_)
+    shares = np.zeros(num_tickers)
+
+    savings = initial_savings
+    days_since_investment = 0
+    daily_growth = 1.0 + daily_rate
+
+    for day_idx in range(num_days):
+        prices = daily_prices[day_idx]
+
+        # Apply daily interest to savings
+        daily_interest[day_idx] = savings * daily_rate
+        savings *= daily_growth
+
+        # Check if it's time to invest (only if investment_amount > 0)
+        invest_today = False
+        if investment_amount > 0:
+            days_since_investment += 1
+
+            if (days_since_investment >= investment_interval and tradable[day_idx]
+                    and (not check_balance or savings >= investment_amount)):
+                # Deduct full investment amount from savings
+                savings -= investment_amount
+                invest_flags[day_idx] = True
+                days_since_investment = 0
+                invest_today = True
+
+        # Invest in each ticker according to allocation, and value the holdings at today's prices
+        value = 0.0
+        for ticker_idx in range(num_tickers):
+            if invest_today:
+                shares[ticker_idx] += ticker_amounts[ticker_idx] / prices[ticker_idx]
+            value += shares[ticker_idx] * prices[ticker_idx]
+
+        portfolio_values[day_idx] = value
+        savings_over_time[day_idx] = savings
+
+    return portfolio_values, savings_over_time, daily_interest, invest_flags, shares
+
+
+@njit(
+    '(float64[:], boolean[:], float64, float64, float64, int64, float64, boolean)',
+    cache=True,
+    fastmath=True
+)
+def _simulate_single(
+    prices: np.ndarray,
+    tradable: np.ndarray,
+    ticker_amount: float,
+    daily_rate: float,
+    investment_amount: float,
+    investment_interval: int,
+    initial_savings: float,
+    check_balance: bool
+) -> tuple:
+    """
+    Single-ticker version of _simulate_core, with scalar share state instead of per-ticker arrays.
 
     Args:
-        stock_data: DataFrame with columns [date, ticker, open, close, volume]
-        date: Date to get price for
+        prices: Closing prices aligned to the daily calendar
+        tradable: Boolean array, True on days where the ticker has a closing price
+        ticker_amount: Amount invested in the ticker per investment
+        daily_rate: Daily interest rate as decimal
+        investment_amount: Fixed amount withdrawn from savings each period
+        investment_interval: Whole number of days between investments
+        initial_savings: Initial amount in savings account
+        check_balance: Whether to check that savings cover each investment
 
     Returns:
-        Closing price as float, or None if date not found
+        Tuple of (portfolio_values, savings_over_time, daily_interest, invest_flags, final_shares),
+        as in _simulate_core but with final_shares as a float
     """
-    # Filter the dataframe for the specific date
-    matching_rows = stock_data[stock_data['Date'] == date]
+    num_days = prices.shape[0]
+    portfolio_values = np.empty(num_days)
+    savings_over_time = np.empty(num_days)
+    daily_interest = np.empty(num_days)
+    invest_flags = np.zeros(num_days, dtype=np.bool_)
+
+    shares = 0.0
+    savings = initial_savings
+    days_since_investment = 0
+    daily_growth = 1.0 + daily_rate
 
-    if matching_rows.empty:
-        return None
+    for day_idx in range(num_days):
+        price = prices[day_idx]
+        daily_interest[day_idx] = savings * daily_rate
+        savings *= daily_growth
+        days_since_investment += 1
 
-    # Get the opening price from the first matching row
-    stock_price = matching_rows['Close'].iloc[0]
+        if (days_since_investment >= investment_interval and tradable[day_idx]
+                and (not check_balance or savings >= investment_amount)):
+            shares += ticker_amount / price
+            savings -= investment_amount
+            invest_flags[day_idx] = True
+            days_since_investment = 0
 
-    return stock_price
+        portfolio_values[day_idx] = shares * price
+        savings_over_time[day_idx] = savings
+
+    return portfolio_values, savings_over_time, daily_interest, invest_flags, shares
 
 
 def calculate_dca_returns(
@@ -157,11 +456,15 @@ def calculate_dca_returns(
             - investment_return: Return from ETF investments only
             - investment_return_rate: ETF return as percentage
             - investment_dates: List of all investment transactions
-            - savings_history: Daily savings balance history
-            - portfolio_value_history: Daily portfolio value history
+            - history: Daily savings, portfolio and total value history, as a dict of NumPy arrays
+                       {'date': datetime64 array, 'savings_balance': float array,
+                        'portfolio_value': float array, 'total_value': float array}
+            - daily_interest: Interest credited to savings each day, as a float array aligned
+                              with the history dates
 
     Raises:
-        ValueError: If stock data cannot be downloaded or if portfolio_structure is invalid
+        ValueError: If stock data cannot be downloaded, if portfolio_structure is invalid or if
+                    end_date is before start_date
     """
     # Validate portfolio structure
     if investment_amount > 0:
@@ -171,136 +474,131 @@ def calculate_dca_returns(
         total_allocation = sum(portfolio_structure.values())
         if not (0.99 <= total_allocation <= 1.01):  # Allow small floating point errors
             raise ValueError(f"Portfolio allocations must sum to 100%. Current sum: {total_allocation*100:.1f}%")
+
+    # Validate date range (the daily calendar must contain at least one day)
+    if pd.to_datetime(end_date) < pd.to_datetime(start_date):
+        raise ValueError("Period end date must be on or after the start date")
+
     # Download stock data for all tickers if we're making investments
     stock_data_dict = {}
     if investment_amount > 0:
-        for ticker in portfolio_structure.keys():
-            stock_data_dict[ticker] = download_stock_data(ticker, start_date, end_date)
+        stock_data_dict = download_stock_data_batch(list(portfolio_structure.keys()), start_date, end_date)
 
     # Calculate daily interest rate
     daily_rate = calculate_daily_interest_rate(annual_interest_rate)
 
-    # Get investment interval in days
-    investment_interval = get_investment_interval_days(investment_frequency)
-
-    # Initialize tracking variables
-    current_savings = initial_savings
-    total_shares_dict = {ticker: 0.0 for ticker in portfolio_structure.keys()}  # Shares per ticker
-    last_known_price_dict = {ticker: 0.0 for ticker in portfolio_structure.keys()}  # Last known price per ticker
-    total_invested = 0.0
-    investment_dates = []
-    savings_history = []
-    portfolio_value_history = []
-    portfolio_value = 0.0  # Initialize portfolio value
+    # Get investment interval in days. The day counter is a whole number, so waiting for
+    # 'counter >= 3.5' is the same as 'counter >= 4': round up once and compare integers.
+    investment_interval = math.ceil(get_investment_interval_days(investment_frequency))
 
     # Create date range
     start = pd.to_datetime(start_date)
     end = pd.to_datetime(end_date)
     date_range = pd.date_range(start=start, end=end, freq='D')
+    num_days = len(date_range)
+
+    # Closing prices aligned to the daily calendar. valid_mask marks the days each ticker actually
+    # traded; price_matrix holds the as-of (last known) close for every day, and the first close
+    # before the first trade, where no shares can be held yet, so it never contains NaN.
+    calendar = date_range.to_numpy()
+    tickers = list(portfolio_structure.keys()) if investment_amount > 0 else []
+    price_matrix = np.empty((len(tickers), num_days))
+    valid_mask = np.zeros((len(tickers), num_days), dtype=bool)
+    for ticker_idx, ticker in enumerate(tickers):
+        # Calendar day of each trade, as whole days since the start date, using int64 nanoseconds
+        trading_ns = stock_data_dict[ticker]['Date'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+        trade_days = (trading_ns - start.value) // NS_PER_DAY
+        in_period = (trade_days >= 0) & (trade_days < num_days)
+        close_prices = stock_data_dict[ticker]['Close'].to_numpy(dtype=np.float64)[in_period]
+        valid_mask[ticker_idx, trade_days[in_period]] = True
+
+        # Trades are in date order, so the running count of trades indexes the as-of close
+        last_trade_idx = np.maximum(np.cumsum(valid_mask[ticker_idx]) - 1, 0)
+        price_matrix[ticker_idx] = close_prices[last_trade_idx]
+
+    # Only invest on days where every ticker in the portfolio has a price
+    tradable = valid_mask.all(axis=0)
+    allocations = np.array([portfolio_structure[ticker] for ticker in tickers], dtype=np.float64)
+    ticker_amounts = investment_amount * allocations
+
+    # Investments are at least investment_interval days apart. With non-negative interest, the balance
+    # before the k-th investment is at least initial_savings - (k - 1) * investment_amount, so if
+    # the savings cover every possible investment up front the per-day balance check can be skipped.
+    max_investments = num_days // investment_interval
+    check_balance = not (daily_rate >= 0 and initial_savings >= max_investments * investment_amount)
+
+    if investment_amount > 0 and len(tickers) == 1:
+        # Single-ticker portfolios (the common case) use the scalar-state kernel
+        portfolio_values, savings_balance, daily_interest, invest_flags, final_share_count = _simulate_single(
+            price_matrix[0],
+            tradable,
+            float(ticker_amounts[0]),
+            float(daily_rate),
+            float(investment_amount),
+            int(investment_interval),
+            float(initial_savings),
+            check_balance
+        )
+        final_shares = np.array([final_share_count])
+    elif investment_amount > 0:
+        # The kernel reads one day's prices at a time, so hand it a day-major copy
+        portfolio_values, savings_balance, daily_interest, invest_flags, final_shares = _simulate_core(
+            np.ascontiguousarray(price_matrix.T),
+            tradable,
+            ticker_amounts,
+            float(daily_rate),
+            float(investment_amount),
+            int(investment_interval),
+            float(initial_savings),
+            check_balance
+        )
+    else:
+        # Savings only: the balance is plain compound interest, read off a table of (1 + rate) powers
+        portfolio_values = np.zeros(num_days)
+        final_shares = np.zeros(0)
+        invest_flags = np.zeros(num_days, dtype=bool)
+        savings_balance = initial_savings * (1.0 + daily_rate) ** np.arange(1, num_days + 1, dtype=np.float64)
+        daily_interest = np.concatenate(([initial_savings], savings_balance[:-1])) * daily_rate
+    current_savings = float(savings_balance[-1])
+
+    # Shares held per ticker at the end of the period
+    total_shares_dict = {ticker: 0.0 for ticker in portfolio_structure.keys()}
+    total_shares_dict.update(zip(tickers, final_shares.tolist()))
+
+    # Build investment records for the days an investment was made
+    invest_days = np.flatnonzero(invest_flags)
+    invest_prices = price_matrix[:, invest_days]
+    invest_shares = ticker_amounts[:, np.newaxis] / invest_prices
 
-    days_since_investment = 0
-
-    # Simulate day-by-day
-    for current_date in date_range:
-        # Apply daily interest to savings
-        daily_interest = current_savings * daily_rate
-        current_savings += daily_interest
-
-        # Check if it's time to invest (only if investment_amount > 0)
-        if investment_amount > 0:
-            days_since_investment += 1
-
-            if days_since_investment >= investment_interval and current_savings >= investment_amount:
-                # Make investments across all tickers in portfolio
-                investment_record = {
-                    'date': current_date,
-                    'total_amount': investment_amount,
-                    'allocations': {}
+    investment_dates = []
+    for record_idx, day_idx in enumerate(invest_days):
+        investment_dates.append({
+            'date': date_range[day_idx],
+            'total_amount': investment_amount,
+            'allocations': {
+                ticker: {
+                    'amount': ticker_amounts[ticker_idx],
+                    'price': invest_prices[ticker_idx, record_idx],
+                    'shares': invest_shares[ticker_idx, record_idx]
                 }
-
-                can_invest = True
-                # Check if all tickers have prices available
-                for ticker in portfolio_structure.keys():
-                    stock_price = get_stock_price(stock_data_dict[ticker], current_date)
-                    if stock_price is None:
-                        can_invest = False
-                        break
-
-                if can_invest:
-                    # Invest in each ticker according to allocation
-                    for ticker, allocation in portfolio_structure.items():
-                        ticker_investment = investment_amount * allocation
-                        stock_price = get_stock_price(stock_data_dict[ticker], current_date)
-                        shares_purchased = ticker_investment / stock_price
-                        total_shares_dict[ticker] += shares_purchased
-
-                        investment_record['allocations'][ticker] = {
-                            'amount': ticker_investment,
-                            'price': stock_price,
-                            'shares': shares_purchased
-                        }
-
-                    # Deduct full investment amount from savings
-                    total_invested += investment_amount
-                    current_savings -= investment_amount
-                    investment_dates.append(investment_record)
-                    days_since_investment = 0
-
-        # Track savings balance
-        savings_history.append({
-            'date': current_date,
-            'savings_balance': current_savings
+                for ticker_idx, ticker in enumerate(tickers)
+            }
         })
 
-        # Calculate portfolio value (only if we have investments)
-        if investment_amount > 0:
-            # Calculate total portfolio value across all tickers with ticker-level forward-filling
-            current_portfolio_value = 0.0
-
-            for ticker, shares in total_shares_dict.items():
-                if shares > 0:
-                    current_stock_price = get_stock_price(stock_data_dict[ticker], current_date)
+    total_invested = investment_amount * len(investment_dates)
 
-                    # Update last known price if we have a current price (trading day for this ticker)
-                    if current_stock_price is not None:
-                        last_known_price_dict[ticker] = current_stock_price
-
-                    # Use last known price for this ticker (forward-fill at ticker level)
-                    ticker_value = shares * last_known_price_dict[ticker]
-                    current_portfolio_value += ticker_value
-
-            portfolio_value = current_portfolio_value
-
-            portfolio_value_history.append({
-                'date': current_date,
-                'portfolio_value': portfolio_value
-            })
-        else:
-            # No investments, portfolio value is always 0
-            portfolio_value_history.append({
-                'date': current_date,
-                'portfolio_value': 0
-            })
-
-    # Final calculations
-    if investment_amount > 0:
-        # Get final prices for all tickers
-        final_stock_prices = {}
-        final_portfolio_value = 0.0
-
-        for ticker, shares in total_shares_dict.items():
-            final_price = get_stock_price(stock_data_dict[ticker], date_range[-1])
-
-            # If final price is None, get the last available price from the stock data
-            if final_price is None:
-                final_price = stock_data_dict[ticker]['Close'].iloc[-1]
+    # Daily history is returned column-wise, one array per column on the same daily calendar
+    history = {
+        'date': calendar,
+        'savings_balance': savings_balance,
+        'portfolio_value': portfolio_values,
+        'total_value': savings_balance + portfolio_values
+    }
 
-            final_stock_prices[ticker] = final_price
-            final_portfolio_value += shares * final_price
-    else:
-        # Savings-only scenario
-        final_stock_prices = {}
-        final_portfolio_value = 0
+    # Final prices are the last known close for each ticker (none for savings-only scenarios)
+    final_prices = price_matrix[:, -1]
+    final_stock_prices = dict(zip(tickers, final_prices))
+    final_portfolio_value = float(final_shares @ final_prices)
 
     final_savings = current_savings
 
@@ -333,6 +631,6 @@ def calculate_dca_returns(
         'investment_return': investment_return,
         'investment_return_rate': investment_return_rate,
         'investment_dates': investment_dates,
-        'savings_history': savings_history,
-        'portfolio_value_history': portfolio_value_history
+        'history': history,
+        'daily_interest': daily_interest
     }
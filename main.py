@@ -2,12 +2,65 @@
 Streamlit app for Lazy Investor - DCA Strategy Calculator
 """
 
+import csv
+import heapq
+import io
+import numpy as np
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
 from datetime import datetime
+from typing import TYPE_CHECKING
+
+from settings import CALCULATIONS_VERSION, INVESTMENT_FREQUENCIES
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_calculate_dca_returns(
+    initial_savings: float,
+    annual_interest_rate: float,
+    investment_amount: float,
+    investment_frequency: str,
+    portfolio_structure: dict,
+    start_date: str,
+    end_date: str,
+    calculations_version: int = CALCULATIONS_VERSION
+) -> dict:
+    """
+    Run calculate_dca_returns, reusing the result when the same inputs were calculated before.
+
+    Results are kept for an hour. calculations_version is part of the cache key only, so bumping
+    CALCULATIONS_VERSION invalidates results cached by older calculation code.
+    """
+    # Imported on the first calculation, so the app loads without NumPy kernels, Numba or yfinance
+    from calculations import calculate_dca_returns
+
+    return calculate_dca_returns(
+        initial_savings=initial_savings,
+        annual_interest_rate=annual_interest_rate,
+        investment_amount=investment_amount,
+        investment_frequency=investment_frequency,
+        portfolio_structure=portfolio_structure,
+        start_date=start_date,
+        end_date=end_date
+    )
+
 
-from calculations import calculate_dca_returns
+# Portfolio shown in the editor when the app opens
+DEFAULT_PORTFOLIO_STRUCTURE = [
+    {'ticker': 'VTI', 'percentage': 30.0},
+    {'ticker': 'QCN.TO', 'percentage': 21.0},
+    {'ticker': 'IEFA', 'percentage': 17.0},
+    {'ticker': 'GLOV', 'percentage': 11.0},
+    {'ticker': 'ZCB.TO', 'percentage': 4.0},
+    {'ticker': 'ZUAG.TO', 'percentage': 4.0},
+    {'ticker': 'EEMV', 'percentage': 4.0},
+    {'ticker': 'ZAG.TO', 'percentage': 5.0},
+    {'ticker': 'GLDM', 'percentage': 3.0},
+    {'ticker': 'ZHY.TO', 'percentage': 1.0}
+]
 
 
 def main():
@@ -38,121 +91,94 @@ def display_main_interface():
         # User Inputs
         st.subheader("📝 Investment Parameters")
 
-        scenario_name = st.text_input(
-            "Scenario Name",
-            value="",
-            placeholder="e.g., Weekly $500 DCA",
-            help="Give this scenario a memorable name"
-        )
-
-        initial_savings = st.number_input(
-            "Initial Savings Amount ($)",
-            min_value=0.0,
-            value=31560.0,
-            step=1000.0,
-            format="%.2f",
-            help="Starting balance in your savings account"
-        )
-
-        annual_interest_rate = st.number_input(
-            "Annual Savings Interest Rate (%)",
-            min_value=0.0,
-            max_value=100.0,
-            value=2.5,
-            step=0.1,
-            format="%.2f",
-            help="Annual interest rate (compounded daily)"
-        )
-
-        investment_amount = st.number_input(
-            "Investment Amount per Period ($)",
-            min_value=0.0,
-            value=500.0,
-            step=50.0,
-            format="%.2f",
-            help="Fixed amount to invest each period. Set to 0 for savings-only."
-        )
-
-        investment_frequency = st.selectbox(
-            "Investment Frequency",
-            options=['Twice a week', 'Weekly', 'Every two weeks', 'Monthly'],
-            index=1,
-            help="How often you invest"
-        )
-
-        start_date = st.date_input(
-            "Period Start Date",
-            value=datetime(2025, 1, 1),
-            help="Start date for investment period"
-        )
-
-        end_date = st.date_input(
-            "Period End Date",
-            value=datetime(2025, 10, 31),
-            help="End date for investment period"
-        )
-
-        st.markdown("**Portfolio Structure**")
-        st.caption("Add tickers and their allocation percentages. Total must equal 100%.")
-
-        # Initialize portfolio structure in session state
-        if 'portfolio_structure' not in st.session_state:
-            st.session_state['portfolio_structure'] = [
-                {'ticker': 'VTI', 'percentage': 30.0},
-                {'ticker': 'QCN.TO', 'percentage': 21.0},
-                {'ticker': 'IEFA', 'percentage': 17.0},
-                {'ticker': 'GLOV', 'percentage': 11.0},
-                {'ticker': 'ZCB.TO', 'percentage': 4.0},
-                {'ticker': 'ZUAG.TO', 'percentage': 4.0},
-                {'ticker': 'EEMV', 'percentage': 4.0},
-                {'ticker': 'ZAG.TO', 'percentage': 5.0},
-                {'ticker': 'GLDM', 'percentage': 3.0},
-                {'ticker': 'ZHY.TO', 'percentage': 1.0}
-            ]
-
-        # Display existing tickers
-        portfolio_structure = []
-        total_percentage = 0.0
-
-        for idx, item in enumerate(st.session_state['portfolio_structure']):
-            col1, col2, col3 = st.columns([2, 1, 0.5])
-
-            with col1:
-                ticker = st.text_input(
-                    f"Ticker {idx + 1}",
-                    value=item['ticker'],
-                    key=f"ticker_{idx}",
-                    label_visibility="collapsed"
-                )
-
-            with col2:
-                percentage = st.number_input(
-                    f"% {idx + 1}",
-                    min_value=0.0,
-                    max_value=100.0,
-                    value=item['percentage'],
-                    step=1.0,
-                    format="%.1f",
-                    key=f"percentage_{idx}",
-                    label_visibility="collapsed"
-                )
-
-            with col3:
-                if len(st.session_state['portfolio_structure']) > 1:
-                    if st.button("🗑️", key=f"delete_{idx}", help="Remove ticker"):
-                        st.session_state['portfolio_structure'].pop(idx)
-                        st.rerun()
-
-            portfolio_structure.append({'ticker': ticker, 'percentage': percentage})
-            total_percentage += percentage
-
-        # Update session state with current values
-        st.session_state['portfolio_structure'] = portfolio_structure
-
-        # Add new ticker button
-        if st.button("➕ Add Ticker", use_container_width=True):
-            st.session_state['portfolio_structure'].append({'ticker': '', 'percentage': 0.0})
-            st.rerun()
+        # Inputs are batched in a form, so editing them doesn't rerun the app until submitted
+        with st.form("scenario_form", clear_on_submit=False):
+            scenario_name = st.text_input(
+                "Scenario Name",
+                value="",
+                placeholder="e.g., Weekly $500 DCA",
+                help="Give this scenario a memorable name"
+            )
+
+            initial_savings = st.number_input(
+                "Initial Savings Amount ($)",
+                min_value=0.0,
+                value=31560.0,
+                step=1000.0,
+                format="%.2f",
+                help="Starting balance in your savings account"
+            )
+
+            annual_interest_rate = st.number_input(
+                "Annual Savings Interest Rate (%)",
+                min_value=0.0,
+                max_value=100.0,
+                value=2.5,
+                step=0.1,
+                format="%.2f",
+                help="Annual interest rate (compounded daily)"
+            )
+
+            investment_amount = st.number_input(
+                "Investment Amount per Period ($)",
+                min_value=0.0,
+                value=500.0,
+                step=50.0,
+                format="%.2f",
+                help="Fixed amount to invest each period. Set to 0 for savings-only."
+            )
+
+            investment_frequency = st.selectbox(
+                "Investment Frequency",
+                options=list(INVESTMENT_FREQUENCIES),
+                index=1,
+                help="How often you invest"
+            )
+
+            start_date = st.date_input(
+                "Period Start Date",
+                value=datetime(2025, 1, 1),
+                help="Start date for investment period"
+            )
+
+            end_date = st.date_input(
+                "Period End Date",
+                value=datetime(2025, 10, 31),
+                help="End date for investment period"
+            )
+
+            st.markdown("**Portfolio Structure**")
+            st.caption("Add or remove rows to change tickers. Allocation percentages must total 100%.")
+
+            edited_portfolio = st.data_editor(
+                pd.DataFrame(DEFAULT_PORTFOLIO_STRUCTURE),
+                num_rows="dynamic",
+                hide_index=True,
+                use_container_width=True,
+                key="portfolio_editor",
+                column_config={
+                    'ticker': st.column_config.TextColumn("Ticker"),
+                    'percentage': st.column_config.NumberColumn(
+                        "Allocation (%)",
+                        min_value=0.0,
+                        max_value=100.0,
+                        step=1.0,
+                        format="%.1f"
+                    )
+                }
+            )
+
+            submitted = st.form_submit_button("Calculate & Save", type="primary", use_container_width=True)
+
+        # Rows added in the editor start out empty
+        portfolio_structure = [
+            {
+                'ticker': ticker if isinstance(ticker, str) else '',
+                'percentage': 0.0 if pd.isna(percentage) else float(percentage)
+            }
+            for ticker, percentage in zip(edited_portfolio['ticker'], edited_portfolio['percentage'])
+        ]
+        total_percentage = sum(item['percentage'] for item in portfolio_structure)
 
         # Show total percentage (only validate if making investments)
         if investment_amount > 0:
@@ -165,74 +191,70 @@ def display_main_interface():
         else:
             st.info("ℹ️ Savings-only mode (no portfolio allocation needed)")
 
-        # Calculate button
-        col1, col2 = st.columns([1, 1])
-
-        with col1:
-            if st.button("Calculate & Save", type="primary", use_container_width=True):
-                # Validation
-                if initial_savings <= 0:
-                    st.warning("Please enter a valid initial savings amount.")
-                elif not scenario_name:
-                    st.warning("Please enter a scenario name")
-                elif scenario_name in st.session_state['saved_scenarios']:
-                    st.warning("Scenario name already exists. Choose a different name.")
-                elif investment_amount > 0 and total_percentage != 100.0:
-                    st.warning(f"Portfolio allocation must equal 100%. Current total: {total_percentage:.1f}%")
-                elif investment_amount > 0 and any(not item['ticker'].strip() for item in portfolio_structure if item['percentage'] > 0):
-                    st.warning("All tickers with non-zero allocation must have a valid symbol")
-                else:
-                    with st.spinner("Calculating your DCA returns..."):
-                        try:
-                            # Convert portfolio structure to dict format (only tickers with allocation)
-                            portfolio_dict = {
-                                item['ticker'].strip(): item['percentage'] / 100.0
-                                for item in portfolio_structure
-                                if item['ticker'].strip() and item['percentage'] > 0
-                            }
-
-                            results = calculate_dca_returns(
-                                initial_savings=initial_savings,
-                                annual_interest_rate=annual_interest_rate,
-                                investment_amount=investment_amount,
-                                investment_frequency=investment_frequency,
-                                portfolio_structure=portfolio_dict,
-                                start_date=start_date.strftime('%Y-%m-%d'),
-                                end_date=end_date.strftime('%Y-%m-%d')
-                            )
-
-                            # Save scenario immediately
-                            save_scenario(scenario_name, results, {
-                                'initial_savings': initial_savings,
-                                'investment_amount': investment_amount,
-                                'investment_frequency': investment_frequency,
-                                'annual_interest_rate': annual_interest_rate,
-                                'start_date': start_date.strftime('%Y-%m-%d'),
-                                'end_date': end_date.strftime('%Y-%m-%d'),
-                                'portfolio_structure': portfolio_dict
-                            })
-
-                            # Store as current results
-                            st.session_state['current_results'] = results
-                            st.session_state['current_scenario_name'] = scenario_name
-
-                            st.success(f"✅ Saved: {scenario_name}")
-                            st.rerun()
-
-                        except ValueError as e:
-                            st.error(str(e))
-                        except Exception as e:
-                            st.error(f"An error occurred: {str(e)}")
-
-        with col2:
-            if st.session_state.get('saved_scenarios'):
-                if st.button("🗑️ Clear All", use_container_width=True):
-                    st.session_state['saved_scenarios'] = {}
-                    if 'current_results' in st.session_state:
-                        del st.session_state['current_results']
-                    if 'current_scenario_name' in st.session_state:
-                        del st.session_state['current_scenario_name']
-                    st.rerun()
+        if submitted:
+            # Validation
+            if initial_savings <= 0:
+                st.warning("Please enter a valid initial savings amount.")
+            elif not scenario_name:
+                st.warning("Please enter a scenario name")
+            elif scenario_name in st.session_state['saved_scenarios']:
+                st.warning("Scenario name already exists. Choose a different name.")
+            elif investment_amount > 0 and total_percentage != 100.0:
+                st.warning(f"Portfolio allocation must equal 100%. Current total: {total_percentage:.1f}%")
+            elif investment_amount > 0 and any(not item['ticker'].strip() for item in portfolio_structure if item['percentage'] > 0):
+                st.warning("All tickers with non-zero allocation must have a valid symbol")
+            else:
+                with st.spinner("Calculating your DCA returns..."):
+                    try:
+                        # Convert portfolio structure to dict format (only tickers with allocation)
+                        portfolio_dict = {
+                            item['ticker'].strip(): item['percentage'] / 100.0
+                            for item in portfolio_structure
+                            if item['ticker'].strip() and item['percentage'] > 0
+                        }
+
+                        results = cached_calculate_dca_returns(
+                            initial_savings=initial_savings,
+                            annual_interest_rate=annual_interest_rate,
+                            investment_amount=investment_amount,
+                            investment_frequency=investment_frequency,
+                            portfolio_structure=portfolio_dict,
+                            start_date=start_date.strftime('%Y-%m-%d'),
+                            end_date=end_date.strftime('%Y-%m-%d'),
+                            calculations_version=CALCULATIONS_VERSION
+                        )
+
+                        # Save scenario immediately
+                        save_scenario(scenario_name, results, {
+                            'initial_savings': initial_savings,
+                            'investment_amount': investment_amount,
+                            'investment_frequency': investment_frequency,
+                            'annual_interest_rate': annual_interest_rate,
+                            'start_date': start_date.strftime('%Y-%m-%d'),
+                            'end_date': end_date.strftime('%Y-%m-%d'),
+                            'portfolio_structure': portfolio_dict
+                        })
+
+                        # Store as current results
+                        st.session_state['current_results'] = st.session_state['saved_scenarios'][scenario_name]['results']
+                        st.session_state['current_scenario_name'] = scenario_name
+
+                        st.success(f"✅ Saved: {scenario_name}")
+                        st.rerun()
+
+                    except ValueError as e:
+                        st.error(str(e))
+                    except Exception as e:
+                        st.error(f"An error occurred: {str(e)}")
+
+        if st.session_state.get('saved_scenarios'):
+            if st.button("🗑️ Clear All", use_container_width=True):
+                st.session_state['saved_scenarios'] = {}
+                if 'current_results' in st.session_state:
+                    del st.session_state['current_results']
+                if 'current_scenario_name' in st.session_state:
+                    del st.session_state['current_scenario_name']
+                st.rerun()
 
     with right_col:
         # Display comparison section if there are saved scenarios
@@ -244,47 +266,127 @@ def display_main_interface():
 
 
 def save_scenario(name: str, results: dict, params: dict):
-    """Save a scenario to session state."""
+    """Save a scenario to session state, along with its daily breakdown frame, chart data and summary row."""
+    frame = build_scenario_frame(results, params)
+
+    # Chart trace data (dates and total values) never changes once saved. These are views of
+    # the frame's columns, so they take no extra memory.
+    trace_data = (frame['date'].to_numpy(), frame['total_value'].to_numpy())
+
+    # The daily history is not read again once the frame is built, so don't keep a second copy
+    # of it in session state. The results dict itself is left untouched.
+    results = {key: value for key, value in results.items() if key != 'history'}
+
+    # Comparison table row, as raw numbers
+    summary_row = {
+        'Scenario': name,
+        'Initial': results['initial_savings'],
+        'Frequency': params['investment_frequency'],
+        'Amount/Period': params['investment_amount'],
+        'Interest': params['annual_interest_rate'],
+        # Format portfolio structure for display
+        'Portfolio': ", ".join([f"{ticker} ({pct*100:.0f}%)"
+                                for ticker, pct in params['portfolio_structure'].items()]),
+        'Final Value': results['total_final_value'],
+        'Total Return': results['total_return'],
+        'Return Rate': results['return_rate']
+    }
+
     st.session_state['saved_scenarios'][name] = {
         'results': results,
         'params': params,
+        'frame': frame,
+        'trace_data': trace_data,
+        'summary_row': summary_row,
         'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     }
 
 
+def build_scenario_frame(results: dict, params: dict) -> pd.DataFrame:
+    """
+    Build the daily breakdown of a scenario, shared by the comparison chart and the CSV export.
+
+    Args:
+        results: Results dict returned by calculate_dca_returns
+        params: Scenario parameters, as stored by save_scenario
+
+    Returns:
+        pd.DataFrame: One row per calendar day with savings, interest, investment, share and
+                      value columns
+    """
+    # One row per investment, with the ticker dicts the CSV shows. Shares owned are accumulated
+    # here, per investment, so they can simply be carried forward between investment days.
+    cumulative_shares = {}
+    investment_rows = []
+    for inv in results['investment_dates']:
+        allocations = inv.get('allocations', {})
+        for ticker, alloc in allocations.items():
+            cumulative_shares[ticker] = cumulative_shares.get(ticker, 0.0) + float(alloc['shares'])
+
+        investment_rows.append({
+            'date': inv['date'],
+            'investment_made': inv.get('total_amount', 0),
+            'stock_prices': str({ticker: float(alloc['price']) for ticker, alloc in allocations.items()}),
+            'shares_purchased': str({ticker: float(alloc['shares']) for ticker, alloc in allocations.items()}),
+            'total_shares_owned': str(cumulative_shares)
+        })
+    investments_df = pd.DataFrame(investment_rows, columns=[
+        'date', 'investment_made', 'stock_prices', 'shares_purchased', 'total_shares_owned'
+    ])
+
+    # Get daily history. It is a dict of NumPy arrays with datetime64 dates, already joined
+    # on the daily calendar, so it can be wrapped without copying or parsing dates
+    combined_df = pd.DataFrame(results['history'], copy=False)
+
+    # Add investment details (no investment, prices or purchases on other days). The dtypes are
+    # set explicitly because a savings-only scenario has no rows to infer them from
+    investments_df = investments_df.astype({
+        'date': combined_df['date'].dtype,
+        'investment_made': np.float64
+    })
+    combined_df = combined_df.merge(investments_df, on='date', how='left')
+    combined_df['investment_made'] = combined_df['investment_made'].fillna(0.0)
+    combined_df['total_shares_owned'] = (
+        combined_df['total_shares_owned'].infer_objects(copy=False).ffill().fillna(str({}))
+    )
+
+    # Interest earned each day, as credited by the simulation, and since the start
+    combined_df['daily_interest_earned'] = results['daily_interest']
+    combined_df['cumulative_interest_earned'] = combined_df['daily_interest_earned'].cumsum()
+
+    # Calculate total return for each day
+    combined_df['total_return'] = combined_df['total_value'] - params['initial_savings']
+    combined_df['return_rate'] = (combined_df['total_return'] / params['initial_savings']) * 100
+
+    return combined_df
+
+
 def display_scenario_comparison(saved_scenarios: dict):
     """Display comparison of all saved scenarios."""
     st.subheader(f"🔍 Scenario Comparison ({len(saved_scenarios)} saved)")
 
-    # Create comparison table
-    comparison_data = []
-    for name in saved_scenarios.keys():
-        scenario = saved_scenarios[name]
-        results = scenario['results']
-        params = scenario['params']
-
-        # Format portfolio structure for display
-        portfolio_str = ", ".join([f"{ticker} ({pct*100:.0f}%)"
-                                   for ticker, pct in params['portfolio_structure'].items()])
-
-        comparison_data.append({
-            'Scenario': name,
-            'Initial': f"${results['initial_savings']:,.0f}",
-            'Frequency': params['investment_frequency'],
-            'Amount/Period': f"${params['investment_amount']:,.0f}",
-            'Interest': f"{params['annual_interest_rate']}%",
-            'Portfolio': portfolio_str,
-            'Final Value': f"${results['total_final_value']:,.0f}",
-            'Total Return': f"${results['total_return']:,.0f}",
-            'Return Rate': f"{results['return_rate']:.1f}%"
-        })
-
-    df_comparison = pd.DataFrame(comparison_data)
-    st.dataframe(df_comparison, use_container_width=True, hide_index=True)
+    # Create comparison table from the rows stored at save time; column_config formats the
+    # raw numbers in the browser
+    df_comparison = pd.DataFrame([scenario['summary_row'] for scenario in saved_scenarios.values()])
+    st.dataframe(
+        df_comparison,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Initial': st.column_config.NumberColumn(format="dollar"),
+            'Amount/Period': st.column_config.NumberColumn(format="dollar"),
+            'Interest': st.column_config.NumberColumn(format="%g%%"),
+            'Final Value': st.column_config.NumberColumn(format="dollar"),
+            'Total Return': st.column_config.NumberColumn(format="dollar"),
+            'Return Rate': st.column_config.NumberColumn(format="%.1f%%")
+        }
+    )
 
     # Highlight best performing scenario
-    best_scenario = max(saved_scenarios.keys(), key=lambda name: saved_scenarios[name]['results']['return_rate'])
-    st.success(f"🏆 Best Return Rate: **{best_scenario}** ({saved_scenarios[best_scenario]['results']['return_rate']:.1f}%)")
+    return_rates = df_comparison['Return Rate'].to_numpy()
+    best_idx = int(np.argmax(return_rates))
+    best_scenario = df_comparison['Scenario'].iat[best_idx]
+    st.success(f"🏆 Best Return Rate: **{best_scenario}** ({return_rates[best_idx]:.1f}%)")
 
     # Scenario selection for visualization
     st.subheader("📈 Total Value Over Time")
@@ -293,11 +395,11 @@ def display_scenario_comparison(saved_scenarios: dict):
     # Use session state to track selected scenarios
     if 'selected_for_chart' not in st.session_state:
         # Default to all scenarios
-        st.session_state['selected_for_chart'] = list(saved_scenarios.keys())
+        st.session_state['selected_for_chart'] = list(saved_scenarios)
 
     # Create checkboxes for each scenario
     selected_scenarios = []
-    for name in saved_scenarios.keys():
+    for name in saved_scenarios:
         # Check if this scenario should be checked
         is_checked = name in st.session_state['selected_for_chart']
 
@@ -341,7 +443,7 @@ def display_scenario_comparison(saved_scenarios: dict):
             """)
 
         # Generate and offer CSV download
-        csv_data = generate_csv_data(saved_scenarios, selected_scenarios)
+        csv_data = get_csv_data(saved_scenarios, selected_scenarios)
         st.download_button(
             label="📥 Download CSV",
             data=csv_data,
@@ -355,35 +457,55 @@ def display_scenario_comparison(saved_scenarios: dict):
 
 def display_comparison_chart(saved_scenarios: dict, selected_scenarios: list):
     """Display interactive line chart comparing total final value over time for selected scenarios."""
-    fig = go.Figure()
+    fig = get_comparison_figure(saved_scenarios)
 
-    for name in selected_scenarios:
-        scenario = saved_scenarios[name]
-        results = scenario['results']
+    # The figure holds every saved scenario; only show the selected ones
+    for trace in fig.data:
+        trace.visible = trace.name in selected_scenarios
 
-        # Get daily history
-        savings_history = pd.DataFrame(results['savings_history'])
-        portfolio_history = pd.DataFrame(results['portfolio_value_history'])
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def get_comparison_figure(saved_scenarios: dict) -> 'go.Figure':
+    """
+    Return the comparison figure for all saved scenarios, rebuilding it only when they change.
+
+    The figure is kept in session state, keyed on the name, save timestamp and results object of
+    each scenario, so selecting and deselecting scenarios reuses it.
+    """
+    figure_key = tuple(
+        (name, scenario['timestamp'], id(scenario['results']))
+        for name, scenario in saved_scenarios.items()
+    )
 
-        # Merge and calculate total final value (savings + portfolio)
-        combined_df = savings_history.merge(portfolio_history, on='date', how='left')
-        combined_df['portfolio_value'] = combined_df['portfolio_value'].fillna(0)
-        combined_df['total_final_value'] = combined_df['savings_balance'] + combined_df['portfolio_value']
-        combined_df['date'] = pd.to_datetime(combined_df['date'])
+    cached = st.session_state.get('comparison_figure')
+    if cached is None or cached[0] != figure_key:
+        cached = (figure_key, build_comparison_figure(saved_scenarios))
+        st.session_state['comparison_figure'] = cached
 
-        # Format values for display
-        combined_df['formatted_value'] = combined_df['total_final_value'].apply(lambda x: f"${x:,.0f}")
+    return cached[1]
+
+
+def build_comparison_figure(saved_scenarios: dict) -> 'go.Figure':
+    """Build a line chart with one total final value trace per saved scenario."""
+    # Plotly is only needed once there is a chart to draw
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+
+    for name, scenario in saved_scenarios.items():
+        # Dates and total values precomputed when the scenario was saved
+        dates, total_values = scenario['trace_data']
 
         # Add trace for this scenario
         fig.add_trace(go.Scatter(
-            x=combined_df['date'],
-            y=combined_df['total_final_value'],
+            x=dates,
+            y=total_values,
             mode='lines',
             name=name,
             line=dict(width=2),
-            hovertemplate='<b>%{meta}</b>: %{customdata}<extra></extra>',
-            meta=[name] * len(combined_df),
-            customdata=combined_df['formatted_value']
+            # Plotly formats the hover value in the browser, so no label strings are sent
+            hovertemplate='<b>%{fullData.name}</b>: $%{y:,.0f}<extra></extra>'
         ))
 
     # Update layout
@@ -411,101 +533,44 @@ def display_comparison_chart(saved_scenarios: dict, selected_scenarios: list):
         )
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
-def generate_csv_data(saved_scenarios: dict, selected_scenarios: list) -> str:
-    """Generate CSV data for selected scenarios with comprehensive daily breakdown."""
+def get_csv_data(saved_scenarios: dict, selected_scenarios: list) -> str:
+    """
+    Return the CSV for the selected scenarios, regenerating it only when its inputs change.
 
-    # Combine data from all selected scenarios
-    all_data = []
+    The last CSV is kept in session state, keyed on the selected scenario names and on the save
+    timestamp and results object of each one, so reruns that don't change the selection or the
+    scenarios (such as typing in the input form) reuse it.
+    """
+    selected = set(selected_scenarios)
+    csv_key = tuple(
+        (name, scenario['timestamp'], id(scenario['results']))
+        for name, scenario in saved_scenarios.items()
+        if name in selected
+    )
 
-    for name in selected_scenarios:
-        scenario = saved_scenarios[name]
-        results = scenario['results']
-        params = scenario['params']
+    cached = st.session_state.get('csv_cache')
+    if cached is None or cached[0] != csv_key:
+        cached = (csv_key, generate_csv_data(saved_scenarios, selected_scenarios))
+        st.session_state['csv_cache'] = cached
 
-        # Get daily history
-        savings_history = pd.DataFrame(results['savings_history'])
-        portfolio_history = pd.DataFrame(results['portfolio_value_history'])
-
-        # Create investment lookup - map dates to investment amounts and details
-        investment_lookup = {}
-        for inv in results['investment_dates']:
-            inv_date = pd.to_datetime(inv['date'])
-            # Sum up all allocations for this date
-            total_amount = inv.get('total_amount', 0)
-            # Store allocation details - we'll use the first ticker's price as representative
-            # (in reality, each ticker has its own price)
-            allocations = inv.get('allocations', {})
-
-            investment_lookup[inv_date] = {
-                'amount': total_amount,
-                'allocations': allocations
-            }
+    return cached[1]
 
-        # Merge the dataframes
-        combined_df = savings_history.merge(portfolio_history, on='date', how='left')
-        combined_df['portfolio_value'] = combined_df['portfolio_value'].fillna(0)
-        combined_df['date'] = pd.to_datetime(combined_df['date'])
 
-        # Calculate daily interest earned
-        combined_df['daily_interest_earned'] = combined_df['savings_balance'].diff()
-        combined_df.loc[0, 'daily_interest_earned'] = combined_df.loc[0, 'savings_balance'] - params['initial_savings']
-
-        # Adjust for withdrawals (when investment was made)
-        for idx, row in combined_df.iterrows():
-            if row['date'] in investment_lookup:
-                # On investment days, the difference includes the withdrawal
-                # So we need to add back the investment amount to get the true interest
-                combined_df.loc[idx, 'daily_interest_earned'] += investment_lookup[row['date']]['amount']
+def generate_csv_data(saved_scenarios: dict, selected_scenarios: list) -> str:
+    """Generate CSV data for selected scenarios with comprehensive daily breakdown."""
 
-        # Calculate cumulative interest earned
-        combined_df['cumulative_interest_earned'] = combined_df['daily_interest_earned'].cumsum()
+    # Rows of each selected scenario, in date order
+    scenario_rows = []
 
-        # Add investment details
-        combined_df['investment_made'] = combined_df['date'].apply(
-            lambda d: investment_lookup[d]['amount'] if d in investment_lookup else 0
-        )
+    for name in selected_scenarios:
+        scenario = saved_scenarios[name]
+        params = scenario['params']
 
-        # For portfolio structure, we'll show stock prices and shares as JSON/dict format
-        def get_stock_prices(date):
-            if date in investment_lookup and investment_lookup[date]['allocations']:
-                return str({ticker: alloc['price']
-                           for ticker, alloc in investment_lookup[date]['allocations'].items()})
-            return None
-
-        def get_shares_purchased(date):
-            if date in investment_lookup and investment_lookup[date]['allocations']:
-                return str({ticker: alloc['shares']
-                           for ticker, alloc in investment_lookup[date]['allocations'].items()})
-            return None
-
-        def get_total_shares_owned(shares_dict_str):
-            """Parse shares purchased strings and accumulate totals"""
-            if not shares_dict_str or shares_dict_str == 'None':
-                return cumulative_shares_str
-            try:
-                import ast
-                shares_dict = ast.literal_eval(shares_dict_str)
-                for ticker, shares in shares_dict.items():
-                    cumulative_shares[ticker] = cumulative_shares.get(ticker, 0.0) + shares
-                return str(cumulative_shares)
-            except:
-                return cumulative_shares_str
-
-        combined_df['stock_prices'] = combined_df['date'].apply(get_stock_prices)
-        combined_df['shares_purchased'] = combined_df['date'].apply(get_shares_purchased)
-
-        # Calculate cumulative shares owned
-        cumulative_shares = {}
-        cumulative_shares_str = str(cumulative_shares)
-        combined_df['total_shares_owned'] = combined_df['shares_purchased'].apply(get_total_shares_owned)
-
-        # Calculate total final value and total return for each day
-        combined_df['total_final_value'] = combined_df['savings_balance'] + combined_df['portfolio_value']
-        combined_df['total_return'] = combined_df['total_final_value'] - params['initial_savings']
-        combined_df['return_rate'] = (combined_df['total_return'] / params['initial_savings']) * 100
+        # Daily breakdown precomputed when the scenario was saved
+        combined_df = scenario['frame'].copy()
 
         # Add scenario name
         combined_df['scenario'] = name
@@ -527,7 +592,7 @@ def generate_csv_data(saved_scenarios: dict, selected_scenarios: list) -> str:
             'shares_purchased',
             'total_shares_owned',
             'portfolio_value',
-            'total_final_value',
+            'total_value',
             'total_return',
             'return_rate'
         ]]
@@ -545,24 +610,26 @@ def generate_csv_data(saved_scenarios: dict, selected_scenarios: list) -> str:
             'shares_purchased': 'Shares Purchased',
             'total_shares_owned': 'Total Shares Owned',
             'portfolio_value': 'Portfolio Value',
-            'total_final_value': 'Total Final Value',
+            'total_value': 'Total Final Value',
             'total_return': 'Total Return',
             'return_rate': 'Return Rate (%)'
         })
 
-        all_data.append(csv_df)
-
-    # Combine all scenarios
-    final_df = pd.concat(all_data, ignore_index=True)
+        # Format date
+        csv_df['Date'] = csv_df['Date'].dt.strftime('%Y-%m-%d')
 
-    # Sort by date ascending, then by scenario
-    final_df = final_df.sort_values(['Date', 'Scenario'], ascending=[True, True])
+        scenario_rows.append(csv_df.itertuples(index=False, name=None))
 
-    # Format date
-    final_df['Date'] = final_df['Date'].dt.strftime('%Y-%m-%d')
+    # Every scenario's rows are already in date order, so merging them by (Date, Scenario) sorts
+    # the combined rows without concatenating all scenarios into one frame first
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator='\n')
+    writer.writerow(csv_df.columns)
+    for row in heapq.merge(*scenario_rows, key=lambda row: (row[0], row[1])):
+        # Missing values (days without an investment) are written as empty fields
+        writer.writerow(['' if pd.isna(value) else value for value in row])
 
-    # Convert to CSV string
-    return final_df.to_csv(index=False)
+    return output.getvalue()
 
 
 if __name__ == "__main__":
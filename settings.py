@@ -0,0 +1,16 @@
+"""
+Settings shared by the Streamlit app and the calculation module.
+
+Kept free of heavy imports so the app can read them without loading the calculation code.
+"""
+
+# Days between investments for each supported investment frequency, in display order
+INVESTMENT_FREQUENCIES = {
+    'Twice a week': 3.5,
+    'Weekly': 7,
+    'Every two weeks': 14,
+    'Monthly': 30
+}
+
+# Bump whenever a change alters calculate_dca_returns results, so cached results are recalculated
+CALCULATIONS_VERSION = 2